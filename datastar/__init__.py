@@ -5,6 +5,7 @@ from .datastar import (
     FragmentConfig,
     MergeType,
     create_sse_stream,
+    sse_encode_fragment,
 )
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     'FragmentConfig',
     'MergeType',
     'create_sse_stream',
+    'sse_encode_fragment',
 ]
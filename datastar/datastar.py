@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-import json
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import (
     Any,
@@ -18,10 +18,13 @@ from typing import (
     Union,
 )
 
+import orjson
 from typing_extensions import Protocol
 
 T = TypeVar('T', bound='DatastarEvent')
 
+_dumps = orjson.dumps
+
 class EventType(str, Enum):
     FRAGMENT = "datastar-fragment"
     SIGNAL = "datastar-signal"
@@ -37,6 +40,20 @@ class MergeType(str, Enum):
     DELETE = "delete"
     UPSERT_ATTRIBUTES = "upsert_attributes"
 
+_EVENT_LINES = {event_type: f"event: {event_type.value}\n".encode() for event_type in EventType}
+_MERGE_LINES = {merge: f"data: merge {merge.value}\n".encode() for merge in MergeType}
+_FRAGMENT_EVENT = b"%sdata: fragment %s\n\n"
+_SIGNAL_EVENT = b"%sdata: %s\n\n"
+
+# Only short fragments are cached: a miss costs more than a hit saves, so
+# the cache only pays off for small, frequently repeated fragments.
+_MAX_CACHED_FRAGMENT_LEN = 64
+
+@functools.lru_cache(maxsize=256)
+def _format_fragment_cached(prefix: bytes, frag: str) -> bytes:
+    """Append a fragment line to an event prefix, caching repeated fragments."""
+    return _FRAGMENT_EVENT % (prefix, frag.encode())
+
 class FragmentConfig(TypedDict, total=False):
     fragment: str
     merge: Optional[MergeType]
@@ -49,9 +66,16 @@ class FragmentConfig(TypedDict, total=False):
 class AsyncDataGenerator(Protocol):
     async def __call__(self) -> AsyncGenerator[Any, None]: ...
 
-@dataclass
-class DatastarEvent:
-    content: Union[List[Union[str, FragmentConfig]], str, FragmentConfig]
+class _DatastarEventCache:
+    """Slots for the SSE lines DatastarEvent precomputes, kept out of its dataclass fields."""
+    __slots__ = ('_option_lines', '_static_prefix', '_format')
+    _option_lines: bytes
+    _static_prefix: bytes
+    _format: Callable[[DatastarEvent, Union[str, FragmentConfig]], bytes]
+
+@dataclass(frozen=True, slots=True)
+class DatastarEvent(_DatastarEventCache):
+    content: Union[List[Union[str, FragmentConfig]], str, FragmentConfig] = field(default_factory=list)
     merge: Optional[MergeType] = None
     selector: Optional[str] = None
     settle_duration: Optional[int] = None
@@ -61,8 +85,20 @@ class DatastarEvent:
     event_type: EventType = EventType.FRAGMENT
 
     def __post_init__(self: DatastarEvent) -> None:
-        """Validate the content type after initialization."""
-        assert isinstance(self.content, (list, str, dict)), "content must be a list, string, or dict"
+        """
+        Precompute the SSE lines shared by every fragment and pick the formatter.
+
+        The event is frozen so that these cached lines always match its fields.
+        The formatter is looked up on the class, so subclass overrides apply, and
+        stored unbound so the event holds no reference to itself.
+        """
+        object.__setattr__(self, '_option_lines', self._format_option_lines())
+        if self.event_type == EventType.FRAGMENT:
+            object.__setattr__(self, '_static_prefix', bytes(self._format_fragment_prefix(self.merge, self.selector)))
+            object.__setattr__(self, '_format', type(self)._format_fragment_sse)
+        else:
+            object.__setattr__(self, '_static_prefix', _EVENT_LINES[self.event_type])
+            object.__setattr__(self, '_format', type(self)._format_signal_sse)
 
     @classmethod
     def create_fragment(cls: Type[T], content: Union[List[Union[str, FragmentConfig]], str, FragmentConfig], **kwargs: Any) -> T:
@@ -76,6 +112,7 @@ class DatastarEvent:
         Returns:
             A DatastarEvent instance (or subclass) configured for a fragment event.
         """
+        assert isinstance(content, (list, str, dict)), "content must be a list, string, or dict"
         return cls(content=content, event_type=EventType.FRAGMENT, **kwargs)
 
     @classmethod
@@ -89,37 +126,83 @@ class DatastarEvent:
         Returns:
             A DatastarEvent instance (or subclass) configured for a signal event.
         """
-        return cls(content=f"store {data}", event_type=EventType.SIGNAL)
+        payload = _dumps(data).decode() if isinstance(data, dict) else data
+        return cls(content=f"store {payload}", event_type=EventType.SIGNAL)
 
-    def _format_fragment_sse(self, fragment: Union[str, FragmentConfig]) -> str:
+    def _format_option_lines(self) -> bytes:
+        """
+        Format the settle, view transition, redirect and error data lines.
+
+        Returns:
+            The encoded data lines, each terminated by a newline.
+        """
+        out = bytearray()
+        if self.settle_duration:
+            out += f"data: settle {self.settle_duration}\n".encode()
+        if self.use_view_transitions is not None:
+            out += b"data: vt true\n" if self.use_view_transitions else b"data: vt false\n"
+        if self.redirect:
+            out += b"data: redirect "
+            out += self.redirect.encode()
+            out += b"\n"
+        if self.error:
+            out += b"data: error "
+            out += self.error.encode()
+            out += b"\n"
+        return bytes(out)
+
+    def _format_fragment_prefix(self, merge: Optional[MergeType], selector: Optional[str]) -> bytearray:
+        """
+        Format the event line and every data line that precedes the fragment.
+
+        Args:
+            merge: The merge type, if any.
+            selector: The selector, if any.
+
+        Returns:
+            The encoded prefix, ready to have the fragment line appended.
+        """
+        out = bytearray(_EVENT_LINES[EventType.FRAGMENT])
+        if merge:
+            out += _MERGE_LINES[merge]
+        if selector:
+            out += b"data: selector "
+            out += selector.encode()
+            out += b"\n"
+        out += self._option_lines
+        return out
+
+    def _format_fragment_sse(self, fragment: Union[str, FragmentConfig]) -> bytes:
         """
         Format a fragment for SSE.
 
+        Fragments that use the event's own merge and selector reuse the
+        precomputed static prefix; only per-fragment overrides rebuild it.
+        Short plain string fragments are served from an LRU cache.
+
         Args:
             fragment: The fragment to format.
 
         Returns:
-            A formatted SSE string for the fragment.
+            The formatted SSE event for the fragment, UTF-8 encoded.
         """
         if isinstance(fragment, dict):
             merge = fragment.get('merge') or self.merge
             selector = fragment.get('selector') or self.selector
             frag = fragment['fragment']
+            if merge != self.merge or selector != self.selector:
+                out = self._format_fragment_prefix(merge, selector)
+                out += b"data: fragment "
+                out += frag.encode()
+                out += b"\n\n"
+                return bytes(out)
+        elif len(fragment) <= _MAX_CACHED_FRAGMENT_LEN:
+            return _format_fragment_cached(self._static_prefix, fragment)
         else:
-            merge, selector, frag = self.merge, self.selector, fragment
-
-        data_lines = [
-            f"merge {merge.value}" if merge else None,
-            f"selector {selector}" if selector else None,
-            f"settle {self.settle_duration}" if self.settle_duration else None,
-            f"vt {str(self.use_view_transitions).lower()}" if self.use_view_transitions is not None else None,
-            f"redirect {self.redirect}" if self.redirect else None,
-            f"error {self.error}" if self.error else None,
-            f"fragment {frag}"
-        ]
-        return '\n'.join(f"data: {line}" for line in data_lines if line is not None)
+            frag = fragment
+        return _FRAGMENT_EVENT % (self._static_prefix, frag.encode())
 
-    def _format_signal_sse(self, data: Union[Dict[str, Any], str]) -> str:
+    def _format_signal_sse(self, data: Union[Dict[str, Any], str]) -> bytes:
         """
         Format a signal for SSE.
 
@@ -127,11 +210,12 @@ class DatastarEvent:
             data: The signal data to format.
 
         Returns:
-            A formatted SSE string for the signal.
+            The formatted SSE event for the signal, UTF-8 encoded.
         """
-        return f"data: {json.dumps(data) if isinstance(data, dict) else str(data)}"
+        payload = _dumps(data) if isinstance(data, dict) else str(data).encode()
+        return _SIGNAL_EVENT % (self._static_prefix, payload)
 
-    def format_sse(self, fragment: Union[str, FragmentConfig]) -> str:
+    def format_sse(self, fragment: Union[str, FragmentConfig]) -> bytes:
         """
         Format an SSE event.
 
@@ -139,76 +223,122 @@ class DatastarEvent:
             fragment: The fragment or signal data to format.
 
         Returns:
-            A formatted SSE string.
+            The formatted SSE event as UTF-8 encoded bytes.
+        """
+        return self._format(self, fragment)
+
+    def _encode(self, content: Union[List[Union[str, FragmentConfig]], str, FragmentConfig, bytes]) -> bytes:
+        """
+        Format content with this event's settings as a single chunk.
+
+        A list produces one SSE event per item, joined so the whole batch
+        reaches the client in one write instead of one write per event.
+
+        Args:
+            content: A single fragment or signal payload, or a list of them.
+                Bytes are taken to be already encoded SSE events and passed through.
+
+        Returns:
+            The formatted SSE events as UTF-8 encoded bytes.
         """
-        data = (self._format_fragment_sse(fragment) if self.event_type == EventType.FRAGMENT
-                else self._format_signal_sse(fragment))
-        return f"event: {self.event_type.value}\n{data}\n\n"
+        if isinstance(content, bytes):
+            return content
+        if isinstance(content, (str, dict)):
+            return self._format(self, content)
+        return b"".join([self._format(self, item) for item in content])
 
-    async def __aiter__(self) -> AsyncIterator[str]:
+    async def __aiter__(self) -> AsyncIterator[bytes]:
         """
-        Asynchronously iterate over the content, yielding formatted SSE strings.
+        Asynchronously iterate over the content, yielding formatted SSE events.
 
         Returns:
-            An async iterator yielding formatted SSE strings for each content item.
+            An async iterator yielding all content items as one chunk of formatted SSE bytes.
         """
-        if isinstance(self.content, (str, dict)):
-            yield self.format_sse(self.content)
-        else:
-            for item in self.content:
-                yield self.format_sse(item)
+        yield self._encode(self.content)
 
-    def stream(self) -> AsyncIterator[str]:
+    def stream(self) -> AsyncIterator[bytes]:
         """
         Return an asynchronous iterator for the event.
 
         Returns:
-            An async iterator yielding formatted SSE strings.
+            An async iterator yielding formatted SSE bytes.
         """
         return self.__aiter__()
 
 class DatastarStreamer:
-    def __init__(self, condition_callable: Callable[[], bool], interval: float = 1.0, sleep_interval: float = 0.1):
+    def __init__(self, condition_callable: Callable[[], bool], interval: float = 1.0, sleep_interval: Optional[float] = 0.1):
         """
         Initialize the DatastarStreamer.
 
         Args:
             condition_callable: A function that returns a boolean indicating whether to stream or not.
             interval: The interval between yielding fragments.
-            sleep_interval: The sleep interval to prevent busy-waiting.
+            sleep_interval: How long to wait for notify() before re-checking the condition.
+                None waits for notify() only, for callers that notify on every change.
         """
         self.condition_callable = condition_callable
         self.interval = interval
         self.sleep_interval = sleep_interval
+        self._wake = asyncio.Event()
+
+    def notify(self) -> None:
+        """Wake all streams waiting on this streamer so they re-check the condition immediately."""
+        self._wake.set()
+        self._wake = asyncio.Event()
+
+    async def _wait_for_wake(self, wake: asyncio.Event) -> None:
+        """
+        Wait until notify() is called or sleep_interval, if set, elapses.
 
-    async def stream(self, fragment_generator: Callable[[], AsyncGenerator[Any, None]]) -> AsyncGenerator[str, None]:
+        Args:
+            wake: The streamer's wake event, taken before the condition was checked,
+                so that a notify() arriving in between is not missed.
+        """
+        try:
+            await asyncio.wait_for(wake.wait(), timeout=self.sleep_interval)
+        except asyncio.TimeoutError:
+            pass
+
+    async def stream(self, fragment_generator: Callable[[], AsyncGenerator[Any, None]]) -> AsyncGenerator[bytes, None]:
         """
         Stream fragments as SSE events.
 
+        The next fragment is only requested from the generator once the
+        condition holds and interval has elapsed since the previous one, so
+        the generator does not need to poll the condition itself.
+
         Args:
-            fragment_generator: A callable that returns an async generator of fragments.
+            fragment_generator: A callable that returns an async generator of fragments,
+                or of events already encoded with sse_encode_fragment.
 
         Yields:
-            Formatted SSE strings.
+            Formatted SSE events as bytes.
         """
-        generator = fragment_generator()
-        last_yield_time = 0
+        event = DatastarEvent()
+        _anext = fragment_generator().__anext__
+        monotonic = asyncio.get_running_loop().time
+        sleep = asyncio.sleep
+        next_yield_time = monotonic()
 
         while True:
             try:
-                current_time = asyncio.get_event_loop().time()
-                if current_time - last_yield_time >= self.interval and self.condition_callable():
-                    fragment = await anext(generator)
-                    event = DatastarEvent(content=fragment)
-                    async for sse_data in event.stream():
-                        yield sse_data
-                    last_yield_time = current_time
-                await asyncio.sleep(self.sleep_interval)
+                wake = self._wake
+                if not self.condition_callable():
+                    await self._wait_for_wake(wake)
+                    continue
+                current_time = monotonic()
+                if current_time < next_yield_time:
+                    await sleep(next_yield_time - current_time)
+                    continue
+                fragment = await _anext()
+                yield event._encode(fragment)
+                next_yield_time = current_time + self.interval
             except StopAsyncIteration:
                 break
             except Exception as e:
                 print(f"Error in DatastarStreamer: {e}")
                 # Depending on your error handling strategy, you might want to yield an error event here
+                break
 
 def create_sse_stream(
     data_generator: AsyncDataGenerator,
@@ -218,12 +348,13 @@ def create_sse_stream(
     use_view_transitions: Optional[bool] = None,
     event_type: EventType = EventType.FRAGMENT,
     interval: float = 1.0
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     """
     Create an SSE stream from a data generator.
 
     Args:
-        data_generator: An async generator that yields data for SSE events.
+        data_generator: An async generator that yields data for SSE events,
+            or events already encoded with sse_encode_fragment.
         merge: The merge type for fragment events.
         selector: The selector for fragment events.
         settle_duration: The settle duration for fragment events.
@@ -232,19 +363,38 @@ def create_sse_stream(
         interval: The interval between events.
 
     Returns:
-        An async generator yielding formatted SSE strings.
+        An async generator yielding formatted SSE bytes.
     """
-    async def generator() -> AsyncGenerator[str, None]:
+    async def generator() -> AsyncGenerator[bytes, None]:
+        event = DatastarEvent(
+            merge=merge,
+            selector=selector,
+            settle_duration=settle_duration,
+            use_view_transitions=use_view_transitions,
+            event_type=event_type
+        )
         async for data in data_generator():
-            event = DatastarEvent(
-                content=data,
-                merge=merge,
-                selector=selector,
-                settle_duration=settle_duration,
-                use_view_transitions=use_view_transitions,
-                event_type=event_type
-            )
-            async for sse_data in event.stream():
-                yield sse_data
+            yield event._encode(data)
             await asyncio.sleep(interval)
     return generator()
+
+def sse_encode_fragment(frag: Union[str, FragmentConfig], defaults: DatastarEvent) -> bytes:
+    """
+    Encode a fragment as an SSE event at the point where it is produced.
+
+    Generators can yield the result to DatastarStreamer.stream or
+    create_sse_stream, which pass encoded events through unchanged.
+    Streamed fragments rarely repeat, so string fragments are passed to
+    format_sse as a FragmentConfig, which is never cached.
+
+    Args:
+        frag: The fragment to encode.
+        defaults: An event carrying the merge, selector and other settings to apply;
+            its content is not used and can be left at the default.
+
+    Returns:
+        The formatted SSE event as UTF-8 encoded bytes.
+    """
+    if isinstance(frag, str):
+        frag = FragmentConfig(fragment=frag)
+    return defaults.format_sse(frag)
@@ -1,11 +1,13 @@
 import asyncio
-import json
 import time
 from enum import Enum
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse, StreamingResponse
 
+_loads = orjson.loads
+
 #region Datastar
 class MergeType(str, Enum):
     MORPH = "morph"
@@ -61,7 +63,7 @@ class DatastarSignal:
 
     def format_sse(self):
         """Format the event data for Server-Sent Events (SSE)."""
-        return f"event: {self.event}\ndata: onlyIfMissing false\ndata: store {json.dumps(self.store)}\n\n"
+        return f"event: {self.event}\ndata: onlyIfMissing false\ndata: store {orjson.dumps(self.store).decode()}\n\n"
 
     async def event_generator(self):
         """Generate the SSE event."""
@@ -105,7 +107,7 @@ html = f"""
 </head>
 <body>
     <h2>Python/FastAPI + Datastar Example</h2>
-    <main class="container" id="main" data-store='{json.dumps(store)}'>
+    <main class="container" id="main" data-store='{orjson.dumps(store).decode()}'>
 
         <hr />
 
@@ -142,6 +144,7 @@ html = f"""
 </body>
 </html>
 """
+html_bytes = html.encode("utf-8")
 
 def datastream(stream) -> StreamingResponse:
     """Create a StreamingResponse for Server-Sent Events (SSE)."""
@@ -154,13 +157,13 @@ def datastream(stream) -> StreamingResponse:
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Serve the root HTML page."""
-    return HTMLResponse(html)
+    return HTMLResponse(html_bytes)
 
 @app.get('/get')
 async def get_data(request: Request):
-    store = json.loads(dict(request.query_params)['datastar'])
+    store = _loads(request.query_params['datastar'])
     store['output'] = f"Your input: {store['input']}, is {len(store['input'])} long."
-    fragment = f'<main id="main" data-store=\'{json.dumps(store)}\'></main>'
+    fragment = f'<main id="main" data-store=\'{orjson.dumps(store).decode()}\'></main>'
     sse = DatastarEvent(
         fragment=fragment,
         merge=MergeType.UPSERT_ATTRIBUTES,
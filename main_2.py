@@ -1,11 +1,15 @@
 import asyncio
-import json
+import functools
 import time
 from typing import AsyncGenerator
+
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse, StreamingResponse
 
-from datastar import DatastarEvent, DatastarStreamer, FragmentConfig, MergeType, create_sse_stream
+from datastar import DatastarEvent, DatastarStreamer, FragmentConfig, MergeType, create_sse_stream, sse_encode_fragment
+
+_loads = orjson.loads
 
 store = {"input": "datastar", "output": "", "_show": False, "message": "", "send": "", "update_store": ""}
 
@@ -17,6 +21,8 @@ send = False
 i = 0
 
 app = FastAPI()
+feed_streamer = DatastarStreamer(condition_callable=lambda: send, interval=1, sleep_interval=None)
+feed_event = DatastarEvent(merge=MergeType.PREPEND, selector='#feeds')
 
 html = f"""
 <!DOCTYPE html>
@@ -30,7 +36,7 @@ html = f"""
 </head>
 <body>
     <h2>Python/FastAPI + Datastar Example</h2>
-    <main class="container" id="main" data-store='{json.dumps(store)}'>
+    <main class="container" id="main" data-store='{orjson.dumps(store).decode()}'>
 
         <hr />
 
@@ -67,8 +73,14 @@ html = f"""
 </body>
 </html>
 """
+html_bytes = html.encode("utf-8")
+
+@functools.lru_cache(maxsize=1)
+def format_time(epoch_sec: int) -> str:
+    """Format a timestamp to the second, reusing the string for every call within that second."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(epoch_sec))
 
-def datastream(stream: AsyncGenerator[str, None]) -> StreamingResponse:
+def datastream(stream: AsyncGenerator[bytes, None]) -> StreamingResponse:
     """Create a StreamingResponse for Server-Sent Events (SSE)."""
     return StreamingResponse(
         stream,
@@ -78,26 +90,26 @@ def datastream(stream: AsyncGenerator[str, None]) -> StreamingResponse:
 
 @app.get("/", response_class=HTMLResponse)
 async def root():
-    return HTMLResponse(html)
+    return HTMLResponse(html_bytes)
 
 @app.get('/get')
 async def get_data(request: Request):
-    store = json.loads(dict(request.query_params)['datastar'])
+    store = _loads(request.query_params['datastar'])
     store['output'] = f"Your input: {store['input']}, is {len(store['input'])} long."
-    fragment = f'<main id="main" data-store=\'{json.dumps(store)}\'></main>'
+    fragment = f'<main id="main" data-store=\'{orjson.dumps(store).decode()}\'></main>'
     event = DatastarEvent.create_fragment(content=fragment, merge=MergeType.UPSERT_ATTRIBUTES)
     return datastream(event.stream())
 
 @app.get('/target')
 async def target_element():
-    current_time = time.strftime("%Y-%m-%d %H:%M:%S")
+    current_time = format_time(int(time.time()))
     fragment = FragmentConfig(fragment=f'<div id="single_target"><b>{current_time}</b></div>')
     event = DatastarEvent(content=fragment)
     return datastream(event.stream())
 
 @app.get('/multi-target')
 async def multi_target():
-    current_time = time.strftime("%Y-%m-%d %H:%M:%S")
+    current_time = format_time(int(time.time()))
     fragments = [
         FragmentConfig(fragment=f'<div id="target_1"><b>{current_time} - Target 1</b></div>', merge=MergeType.INNER),
         FragmentConfig(fragment=f'<div id="target_2"><b>{current_time} - Target 2</b></div>', merge=MergeType.PREPEND, selector='#target_2'),
@@ -108,7 +120,7 @@ async def multi_target():
 
 @app.get('/update-store')
 async def update_store():
-    current_time = time.strftime("%Y-%m-%d %H:%M:%S")
+    current_time = format_time(int(time.time()))
     event = DatastarEvent.create_signal(data={'update_store': f'Update `data-store` only: {current_time}'})
     return datastream(event.stream())
 
@@ -116,6 +128,7 @@ async def update_store():
 async def toggle_feed():
     global send
     send = not send
+    feed_streamer.notify()
     event = DatastarEvent.create_signal(data={'send': send})
     return datastream(event.stream())
 
@@ -123,22 +136,14 @@ async def toggle_feed():
 async def feed():
     global send, i
 
-    async def data_generator() -> AsyncGenerator[FragmentConfig, None]:
+    async def data_generator() -> AsyncGenerator[bytes, None]:
         global i
-        while True:
-            if send:
-                i += 1
-                current_time = time.strftime("%Y-%m-%d %H:%M:%S")
-                yield FragmentConfig(
-                    fragment=f'<div id="feed">{i} - {current_time}</div>',
-                    merge=MergeType.PREPEND,
-                    selector='#feeds',
-                    use_view_transitions=False,
-                )
-            await asyncio.sleep(1)  # Control rate of fragment generation
+        while True:  # feed_streamer paces this and only pulls while send is on
+            i += 1
+            current_time = format_time(int(time.time()))
+            yield sse_encode_fragment(f'<div id="feed">{i} - {current_time}</div>', feed_event)
 
-    streamer = DatastarStreamer(condition_callable=lambda: send, interval=0.1)
-    return datastream(streamer.stream(data_generator))
+    return datastream(feed_streamer.stream(data_generator))
 
 # Alternative implementation using create_sse_stream
 @app.get('/feed_alt')
@@ -150,7 +155,7 @@ async def feed_alt():
         while True:
             if send:
                 i += 1
-                current_time = time.strftime("%Y-%m-%d %H:%M:%S")
+                current_time = format_time(int(time.time()))
                 yield FragmentConfig(
                     fragment=f'<div id="feed">{i} - {current_time}</div>',
                     merge=MergeType.PREPEND,